@@ -4,21 +4,34 @@ FastAPI backend for the Claims Processing Agent.
 from fastapi import FastAPI, File, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
 import tempfile
 import os
-import json
+import time
+import orjson
+import aiofiles
 from pathlib import Path
 
+from dotenv import load_dotenv
+
 from src.agent import ClaimsProcessingAgent
 
+# Load .env eagerly: under `uvicorn api:app` nothing else runs before the
+# first request, and key resolution must see GEMINI_API_KEY from the start
+load_dotenv()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Insurance Claims Processing Agent",
     description="AI-powered autonomous FNOL document processing",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -38,9 +51,33 @@ if web_dir.exists():
 # Configuration file for storing settings
 CONFIG_FILE = Path(__file__).parent / ".config.json"
 
-# Initialize the agent
-agent = None
+# Accepted upload extensions
+_ALLOWED_EXT: frozenset = frozenset({'.pdf', '.txt'})
+
+# Optional process pool for CPU-bound PDF parsing. PyPDF2 is pure Python and
+# holds the GIL, so when parsing dominates (rather than the Gemini HTTP call)
+# a process pool gives true parallelism across cores.
+USE_PROCESS_POOL = os.getenv("USE_PROCESS_POOL", "0") == "1"
+_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+# Chunk size for streaming uploads to disk (64 KiB keeps syscall count low)
+UPLOAD_BUFFER_SIZE = 65536
+
+# Maximum accepted upload size; enforced while streaming so an oversized POST
+# is rejected before it fills the disk (default 50 MiB)
+MAX_UPLOAD_BYTES = int(os.getenv('MAX_UPLOAD_BYTES', str(50 * 1024 * 1024)))
 
+# Routing rules are static configuration; cache the response once per process
+_ROUTING_RULES_CACHE: Optional[Dict[str, Any]] = None
+
+# In-process cache of the parsed config file, keyed by mtime so steady-state
+# reads cost a single stat() instead of a read + JSON parse per request
+_CONFIG_CACHE: Dict[str, Any] = {"mtime": None, "data": {}}
+
+# Short-TTL cache of the resolved API key so the /process hot path skips even
+# the stat + environment lookup; invalidated when the key is changed
+_KEY_CACHE: Dict[str, Any] = {"t": 0.0, "v": None}
+_KEY_CACHE_TTL = 5.0  # seconds
 
 class APIKeyConfig(BaseModel):
     """Model for API key configuration."""
@@ -49,50 +86,158 @@ class APIKeyConfig(BaseModel):
 
 
 def load_config() -> Dict[str, Any]:
-    """Load configuration from file."""
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE, 'r') as f:
-                return json.load(f)
-        except Exception:
-            return {}
-    return {}
+    """Load configuration from file (cached until the file changes on disk).
+
+    Returns a copy: the cache must only ever mirror what is on disk, so
+    callers may mutate the result freely before saving it back.
+    """
+    try:
+        mtime = CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+
+    if _CONFIG_CACHE["mtime"] == mtime:
+        return dict(_CONFIG_CACHE["data"])
+
+    try:
+        with open(CONFIG_FILE, 'rb') as f:
+            data = orjson.loads(f.read())
+    except Exception:
+        return {}
+
+    _CONFIG_CACHE["mtime"] = mtime
+    _CONFIG_CACHE["data"] = data
+    return dict(data)
+
+
+async def _load_config_async() -> Dict[str, Any]:
+    """Async variant of load_config for use inside request handlers.
+
+    Shares the mtime cache with load_config so the hot path is a single
+    stat(); only cache misses touch the event loop with real I/O.
+    """
+    try:
+        mtime = CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+
+    if _CONFIG_CACHE["mtime"] == mtime:
+        return dict(_CONFIG_CACHE["data"])
+
+    try:
+        async with aiofiles.open(CONFIG_FILE, 'rb') as f:
+            data = orjson.loads(await f.read())
+    except Exception:
+        return {}
+
+    _CONFIG_CACHE["mtime"] = mtime
+    _CONFIG_CACHE["data"] = data
+    return dict(data)
+
+
+async def _save_config_async(config: Dict[str, Any]) -> None:
+    """Async variant of save_config for use inside request handlers."""
+    try:
+        tmp = CONFIG_FILE.with_suffix('.json.tmp')
+        async with aiofiles.open(tmp, 'wb') as f:
+            await f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        os.replace(tmp, CONFIG_FILE)
+        _CONFIG_CACHE["mtime"] = CONFIG_FILE.stat().st_mtime_ns
+        _CONFIG_CACHE["data"] = dict(config)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to save configuration: {str(e)}")
 
 
 def save_config(config: Dict[str, Any]) -> None:
     """Save configuration to file."""
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        # Write the whole buffer to a sibling file and rename atomically so a
+        # crash mid-write can never truncate the real config
+        tmp = CONFIG_FILE.with_suffix('.json.tmp')
+        tmp.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        os.replace(tmp, CONFIG_FILE)
+        # Keep the cache warm so the next load_config() is a hit
+        _CONFIG_CACHE["mtime"] = CONFIG_FILE.stat().st_mtime_ns
+        _CONFIG_CACHE["data"] = dict(config)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save configuration: {str(e)}")
 
 
-def get_api_key() -> Optional[str]:
-    """Get API key from config file or environment."""
+def _resolve_api_key(config: Dict[str, Any]) -> Optional[str]:
+    """Resolve the API key from an already-loaded config, then the environment."""
     # First check config file
-    config = load_config()
-    if 'gemini_api_key' in config and config['gemini_api_key']:
+    if config.get('gemini_api_key'):
         return config['gemini_api_key']
-    
+
     # Fall back to environment variable
     return os.getenv('GEMINI_API_KEY')
 
 
+def get_api_key() -> Optional[str]:
+    """Get API key from config file or environment (cached for a few seconds)."""
+    now = time.monotonic()
+    if now - _KEY_CACHE["t"] < _KEY_CACHE_TTL:
+        return _KEY_CACHE["v"]
+
+    key = _resolve_api_key(load_config())
+    _KEY_CACHE["t"] = now
+    _KEY_CACHE["v"] = key
+    return key
+
+
+def _invalidate_api_key_cache() -> None:
+    """Force the next get_api_key() to re-resolve."""
+    _KEY_CACHE["t"] = 0.0
+
+
+@functools.lru_cache(maxsize=4)
+def _build_agent(api_key: Optional[str]) -> ClaimsProcessingAgent:
+    """Build (and memoize) an agent for the given API key."""
+    return ClaimsProcessingAgent(api_key=api_key)
+
+
 def get_agent(force_reload: bool = False) -> ClaimsProcessingAgent:
     """Get or create the claims processing agent."""
-    global agent
-    
-    # Reload agent if requested or not initialized
-    if force_reload or agent is None:
-        api_key = get_api_key()
-        try:
-            agent = ClaimsProcessingAgent(api_key=api_key)
-        except Exception as e:
-            # If agent creation fails, create without API key (will use fallback)
-            agent = ClaimsProcessingAgent(api_key=None)
-    
-    return agent
+    if force_reload:
+        _build_agent.cache_clear()
+
+    try:
+        return _build_agent(get_api_key())
+    except Exception:
+        # If agent creation fails, create without API key (will use fallback)
+        return _build_agent(None)
+
+
+def _process_claim_in_subprocess(api_key: Optional[str], document_path: str) -> Dict[str, Any]:
+    """Process a claim inside a pool worker (agents are cached per process)."""
+    return _build_agent(api_key).process_claim(document_path)
+
+
+@app.on_event("startup")
+async def _create_process_pool():
+    global _pool
+    if USE_PROCESS_POOL:
+        _pool = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+@app.on_event("startup")
+async def _create_upload_dir():
+    # One temp directory for all uploads: keeps /tmp traversal cached and
+    # lets shutdown clean everything up with a single rmtree
+    app.state.tmpdir = tempfile.TemporaryDirectory(prefix='synapx-')
+
+
+@app.on_event("shutdown")
+async def _shutdown_process_pool():
+    if _pool is not None:
+        _pool.shutdown(wait=False)
+
+
+@app.on_event("shutdown")
+async def _cleanup_upload_dir():
+    tmpdir = getattr(app.state, "tmpdir", None)
+    if tmpdir is not None:
+        tmpdir.cleanup()
 
 
 class ProcessingResult(BaseModel):
@@ -135,36 +280,59 @@ async def process_claim(file: UploadFile = File(...)):
         raise HTTPException(status_code=400, detail="No file provided")
     
     file_ext = Path(file.filename).suffix.lower()
-    if file_ext not in ['.pdf', '.txt']:
+    if file_ext not in _ALLOWED_EXT:
         raise HTTPException(
             status_code=400,
             detail=f"Unsupported file format: {file_ext}. Please upload PDF or TXT files."
         )
     
-    # Save uploaded file to temporary location
+    # Stream uploaded file to a temporary location in 64 KiB chunks so large
+    # PDFs are never fully buffered in memory
+    tmp_path: Optional[str] = None
+    upload_dir = getattr(app.state, "tmpdir", None)
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
-            tmp_path = tmp_file.name
-        
-        # Process the claim
-        claims_agent = get_agent()
-        result = claims_agent.process_claim(tmp_path)
+        fd, tmp_path = tempfile.mkstemp(
+            suffix=file_ext,
+            dir=upload_dir.name if upload_dir is not None else None
+        )
+        os.close(fd)
+        total = 0
+        async with aiofiles.open(tmp_path, 'wb') as tmp_file:
+            while chunk := await file.read(UPLOAD_BUFFER_SIZE):
+                total += len(chunk)
+                if total > MAX_UPLOAD_BYTES:
+                    raise HTTPException(status_code=413, detail="File too large")
+                await tmp_file.write(chunk)
+
+        # Process the claim off the event loop so other requests stay
+        # responsive: a subprocess when PDF parsing is the bottleneck,
+        # otherwise a worker thread (the LLM call releases the GIL)
+        if _pool is not None:
+            result = await asyncio.get_running_loop().run_in_executor(
+                _pool, _process_claim_in_subprocess, get_api_key(), tmp_path
+            )
+        else:
+            claims_agent = get_agent()
+            result = await asyncio.to_thread(claims_agent.process_claim, tmp_path)
         
         # Clean up temporary file
         os.unlink(tmp_path)
         
         return result
         
+    except HTTPException:
+        # Already a proper API error (e.g. 413); clean up and re-raise as-is
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+        raise
+
     except Exception as e:
         # Clean up temporary file if it exists
-        if 'tmp_path' in locals():
-            try:
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
                 os.unlink(tmp_path)
-            except:
-                pass
-        
+
         raise HTTPException(
             status_code=500,
             detail=f"Error processing claim: {str(e)}"
@@ -190,18 +358,23 @@ async def health_check():
 @app.get("/routing-rules")
 async def get_routing_rules():
     """Get the routing rules summary."""
-    claims_agent = get_agent()
-    return {
-        "rules": claims_agent.router.get_routing_summary(),
-        "fast_track_threshold": claims_agent.router.FAST_TRACK_THRESHOLD
-    }
+    global _ROUTING_RULES_CACHE
+
+    if _ROUTING_RULES_CACHE is None:
+        claims_agent = get_agent()
+        _ROUTING_RULES_CACHE = {
+            "rules": claims_agent.router.get_routing_summary(),
+            "fast_track_threshold": claims_agent.router.FAST_TRACK_THRESHOLD
+        }
+
+    return _ROUTING_RULES_CACHE
 
 
 @app.get("/config")
 async def get_config():
     """Get current configuration status."""
-    api_key = get_api_key()
-    config = load_config()
+    config = await _load_config_async()
+    api_key = _resolve_api_key(config)
     
     return {
         "has_api_key": bool(api_key),
@@ -224,15 +397,16 @@ async def set_api_key(config: APIKeyConfig):
     """
     try:
         # Get current config
-        current_config = load_config()
-        
+        current_config = await _load_config_async()
+
         # Update API key
         current_config['gemini_api_key'] = config.api_key.strip()
-        
+
         # Save configuration
-        save_config(current_config)
-        
+        await _save_config_async(current_config)
+
         # Reload agent with new API key
+        _invalidate_api_key_cache()
         get_agent(force_reload=True)
         
         return {
@@ -258,16 +432,17 @@ async def remove_api_key():
     """
     try:
         # Get current config
-        current_config = load_config()
-        
+        current_config = await _load_config_async()
+
         # Remove API key
         if 'gemini_api_key' in current_config:
             del current_config['gemini_api_key']
-        
+
         # Save configuration
-        save_config(current_config)
-        
+        await _save_config_async(current_config)
+
         # Reload agent without API key
+        _invalidate_api_key_cache()
         get_agent(force_reload=True)
         
         return {
@@ -294,6 +469,9 @@ if __name__ == "__main__":
     # Get configuration from environment
     host = os.getenv("API_HOST", "0.0.0.0")
     port = int(os.getenv("API_PORT", "8000"))
+    # Worker count: API_WORKERS/WEB_CONCURRENCY, defaulting to CPU count
+    # (a common rule of thumb for I/O-heavy services is 2n+1)
+    workers = int(os.getenv("API_WORKERS", os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))))
     
     print(f"""
     ╔═══════════════════════════════════════════════════════════╗
@@ -309,4 +487,5 @@ if __name__ == "__main__":
     Press Ctrl+C to stop the server.
     """)
     
-    uvicorn.run(app, host=host, port=port)
+    # Import-string form is required for multi-worker mode
+    uvicorn.run("api:app", host=host, port=port, workers=workers)
@@ -20,26 +20,31 @@ def check_python_version():
 
 def check_dependencies():
     """Check if required packages are installed."""
-    required = [
-        'fastapi',
-        'uvicorn',
-        'pydantic',
-        'google.generativeai',
-        'PyPDF2',
-        'python-dotenv'
-    ]
-    
+    import importlib.util
+
+    # Display name -> importable module name
+    required = {
+        'fastapi': 'fastapi',
+        'uvicorn': 'uvicorn',
+        'pydantic': 'pydantic',
+        'google.generativeai': 'google.generativeai',
+        'PyPDF2': 'PyPDF2',
+        'python-dotenv': 'dotenv',
+    }
+
     missing = []
-    for package in required:
+    for package, modname in required.items():
+        # find_spec verifies installation without importing the module
+        # (importing google.generativeai alone costs hundreds of ms). For a
+        # dotted name it still imports the parent package, which raises when
+        # that parent is absent too - treat that the same as not installed.
         try:
-            if package == 'python-dotenv':
-                __import__('dotenv')
-            elif package == 'google.generativeai':
-                __import__('google.generativeai')
-            else:
-                __import__(package)
+            spec = importlib.util.find_spec(modname)
+        except ModuleNotFoundError:
+            spec = None
+        if spec is not None:
             print(f"✅ {package}")
-        except ImportError:
+        else:
             print(f"❌ {package} (not installed)")
             missing.append(package)
     
@@ -64,17 +69,17 @@ def check_env_file():
         return False
     
     print("✅ .env file exists")
-    
-    # Check if API key is set
-    with open(env_file) as f:
-        content = f.read()
-        if 'GEMINI_API_KEY' not in content:
-            print("⚠️  GEMINI_API_KEY not found in .env")
-            return False
-        elif 'your_api_key_here' in content:
-            print("⚠️  Please replace 'your_api_key_here' with your actual API key")
-            return False
-    
+
+    # Check if API key is set (single parse, and rejects empty values too)
+    from dotenv import dotenv_values
+    key = dotenv_values(env_file).get('GEMINI_API_KEY')
+    if not key:
+        print("⚠️  GEMINI_API_KEY not found in .env")
+        return False
+    elif key == 'your_api_key_here':
+        print("⚠️  Please replace 'your_api_key_here' with your actual API key")
+        return False
+
     print("✅ GEMINI_API_KEY configured")
     return True
 
@@ -99,7 +104,7 @@ def check_sample_documents():
 def check_web_files():
     """Check if web interface files exist."""
     web_dir = Path('web')
-    required_files = ['index.html', 'styles.css', 'script.js']
+    required_files = frozenset({'index.html', 'styles.css', 'script.js'})
     
     if not web_dir.exists():
         print("❌ web directory not found")
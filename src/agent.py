@@ -3,7 +3,10 @@ Main Claims Processing Agent
 """
 import sys
 import os
-from typing import Dict, Any, Optional
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 from src.extractor import FieldExtractor
@@ -11,6 +14,8 @@ from src.validator import FieldValidator
 from src.router import ClaimRouter
 from src.utils import read_document, format_output, save_output
 
+logger = logging.getLogger(__name__)
+
 
 class ClaimsProcessingAgent:
     """
@@ -48,37 +53,50 @@ class ClaimsProcessingAgent:
                 - recommendedRoute: Routing destination
                 - reasoning: Explanation for routing decision
         """
-        print(f"\n{'='*60}")
-        print(f"Processing: {document_path}")
-        print(f"{'='*60}\n")
-        
+        logger.debug("Processing: %s", document_path)
+
         # Step 1: Read document
-        print("📄 Reading document...")
         document_text = read_document(document_path)
-        print(f"   ✓ Extracted {len(document_text)} characters\n")
-        
+        logger.info("Extracted %d characters from %s", len(document_text), document_path)
+
+        return self.process_claim_text(document_text, file_path=document_path)
+
+    def process_claim_text(
+        self,
+        document_text: str,
+        file_path: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Process a claim whose document text has already been read.
+
+        Useful when the caller holds the content in memory (e.g. batch
+        readers or tests that pre-load the sample files once).
+
+        Args:
+            document_text: Raw text of the FNOL document
+            file_path: Optional path to the original file (for fallback OCR)
+
+        Returns:
+            Same result dictionary as process_claim
+        """
         # Step 2: Extract fields using AI
-        print("🤖 Extracting fields with AI...")
-        extracted_fields = self.extractor.extract_fields(document_text, file_path=document_path)
-        print(f"   ✓ Extracted {len([v for v in extracted_fields.values() if v])} fields\n")
-        
+        extracted_fields = self.extractor.extract_fields(document_text, file_path=file_path)
+        logger.info("Extracted %d fields", len([v for v in extracted_fields.values() if v]))
+
         # Step 3: Validate fields
-        print("✅ Validating fields...")
         missing_fields = self.validator.validate(extracted_fields)
         if missing_fields:
-            print(f"   ⚠ Missing {len(missing_fields)} mandatory fields")
-            for field in missing_fields:
-                display_name = self.validator.get_field_name_display(field)
-                print(f"      - {display_name}")
+            logger.info(
+                "Missing %d mandatory fields: %s",
+                len(missing_fields),
+                ", ".join(self.validator.get_field_name_display(f) for f in missing_fields)
+            )
         else:
-            print("   ✓ All mandatory fields present")
-        print()
-        
+            logger.info("All mandatory fields present")
+
         # Step 4: Route claim
-        print("🔀 Routing claim...")
         route, reasoning = self.router.route_claim(extracted_fields, missing_fields)
-        print(f"   → Route: {route}")
-        print(f"   → Reason: {reasoning}\n")
+        logger.info("Route: %s (%s)", route, reasoning)
         
         # Prepare result
         result = {
@@ -90,6 +108,77 @@ class ClaimsProcessingAgent:
         
         return result
     
+    async def aprocess_claim(self, document_path: str) -> Dict[str, Any]:
+        """
+        Async variant of process_claim.
+
+        File reading is offloaded to a thread and extraction uses Gemini's
+        async client, so several claims awaited with asyncio.gather finish
+        in roughly the latency of the slowest one.
+
+        Args:
+            document_path: Path to the FNOL document (PDF or TXT)
+
+        Returns:
+            Same result dictionary as process_claim
+        """
+        document_text = await asyncio.to_thread(read_document, document_path)
+        extracted_fields = await self.extractor.aextract_fields(
+            document_text, file_path=document_path
+        )
+
+        missing_fields = self.validator.validate(extracted_fields)
+        route, reasoning = self.router.route_claim(extracted_fields, missing_fields)
+
+        return {
+            "extractedFields": extracted_fields,
+            "missingFields": missing_fields,
+            "recommendedRoute": route,
+            "reasoning": reasoning
+        }
+
+    def process_claims_batch(self, document_paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Process several FNOL documents with a single Gemini request.
+
+        All documents are extracted in one batched prompt (one API
+        round-trip instead of one per claim), then validated and routed
+        individually.
+
+        Args:
+            document_paths: Paths to the FNOL documents (PDF or TXT)
+
+        Returns:
+            One process_claim-style result dictionary per input, in order
+        """
+        texts = [read_document(path) for path in document_paths]
+        return self.process_claims_batch_texts(texts)
+
+    def process_claims_batch_texts(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Process several claims whose document texts are already in memory.
+
+        Args:
+            texts: Raw text of each FNOL document
+
+        Returns:
+            One process_claim-style result dictionary per input, in order
+        """
+        extracted = self.extractor.extract_fields_multi(texts)
+
+        results = []
+        for extracted_fields in extracted:
+            missing_fields = self.validator.validate(extracted_fields)
+            route, reasoning = self.router.route_claim(extracted_fields, missing_fields)
+            results.append({
+                "extractedFields": extracted_fields,
+                "missingFields": missing_fields,
+                "recommendedRoute": route,
+                "reasoning": reasoning
+            })
+
+        return results
+
     def process_batch(self, document_dir: str, output_dir: Optional[str] = None) -> None:
         """
         Process all FNOL documents in a directory.
@@ -103,39 +192,55 @@ class ClaimsProcessingAgent:
         if not doc_path.exists():
             raise FileNotFoundError(f"Directory not found: {document_dir}")
         
-        # Find all supported documents
-        documents = []
-        for ext in ['*.txt', '*.pdf']:
-            documents.extend(doc_path.glob(ext))
-        
+        # Find all supported documents in a single directory scan
+        with os.scandir(doc_path) as it:
+            documents = [
+                Path(entry.path) for entry in it
+                if entry.is_file() and entry.name.lower().endswith(('.txt', '.pdf'))
+            ]
+
         if not documents:
             print(f"No documents found in {document_dir}")
             return
         
         print(f"\n🚀 Processing {len(documents)} documents from {document_dir}\n")
-        
-        results = []
-        for doc in sorted(documents):
-            try:
-                result = self.process_claim(str(doc))
-                results.append({
-                    "document": doc.name,
-                    "result": result
-                })
-                
-                # Save individual output if output_dir specified
-                if output_dir:
-                    output_path = Path(output_dir) / f"{doc.stem}_result.json"
-                    output_path.parent.mkdir(parents=True, exist_ok=True)
-                    save_output(result, str(output_path))
-                    print(f"💾 Saved output to: {output_path}\n")
-                
-            except Exception as e:
-                print(f"❌ Error processing {doc.name}: {str(e)}\n")
-                results.append({
-                    "document": doc.name,
-                    "error": str(e)
-                })
+
+        # Process documents concurrently - each claim spends most of its time
+        # blocked on the Gemini API and file I/O, so a thread pool overlaps them
+        documents = sorted(documents)
+        max_workers = int(os.getenv('BATCH_WORKERS', '8'))
+        results_by_name = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.process_claim, str(doc)): doc
+                for doc in documents
+            }
+            for future in as_completed(futures):
+                doc = futures[future]
+                try:
+                    result = future.result()
+                    results_by_name[doc.name] = {
+                        "document": doc.name,
+                        "result": result
+                    }
+
+                    # Save individual output if output_dir specified
+                    if output_dir:
+                        output_path = Path(output_dir) / f"{doc.stem}_result.json"
+                        output_path.parent.mkdir(parents=True, exist_ok=True)
+                        save_output(result, str(output_path))
+                        print(f"💾 Saved output to: {output_path}\n")
+
+                except Exception as e:
+                    print(f"❌ Error processing {doc.name}: {str(e)}\n")
+                    results_by_name[doc.name] = {
+                        "document": doc.name,
+                        "error": str(e)
+                    }
+
+        # Preserve the original document ordering in the summary
+        results = [results_by_name[doc.name] for doc in documents]
         
         # Print summary
         print("\n" + "="*60)
@@ -190,7 +295,10 @@ def main():
     )
     
     args = parser.parse_args()
-    
+
+    # CLI runs want per-step progress; the API configures its own level
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+
     try:
         agent = ClaimsProcessingAgent()
         
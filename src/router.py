@@ -1,13 +1,72 @@
 """
 Claim routing engine that classifies and routes claims based on business rules.
 """
+import re
 from typing import Dict, Any, Tuple, List
 from src.utils import contains_fraud_indicators
 
+# Injury keywords checked against claim type + description. Matching is
+# plain substring ('hospital' also catches 'hospitalized'), mirroring the
+# original per-keyword `in` checks.
+_INJURY_KEYWORDS = (
+    "injury",
+    "injured",
+    "bodily harm",
+    "bodily injury",
+    "medical",
+    "hospital",
+    "ambulance",
+    "hurt",
+    "pain",
+    "personal injury",
+)
+
+# Compiled alternation shared by all router instances: a single C-level scan
+# replaces per-keyword substring searches plus a lowercase copy
+_INJURY_RE = re.compile(
+    '|'.join(map(re.escape, _INJURY_KEYWORDS)),
+    re.IGNORECASE
+)
+
+# Optional Hyperscan backend: one vectorized DFA pass over the combined
+# claim-type + description text, matching the fraud path in src.utils
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Optional Aho-Corasick automaton for the injury keywords (single O(N) pass)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+_INJURY_AC = None
+if ahocorasick is not None:
+    _INJURY_AC = ahocorasick.Automaton()
+    for _kw in _INJURY_KEYWORDS:
+        _INJURY_AC.add_word(_kw, _kw)
+    _INJURY_AC.make_automaton()
+
+_INJURY_HS_DB = None
+if hyperscan is not None:
+    try:
+        # Escaped literals with no \b anchors: every backend does the same
+        # plain substring matching as _INJURY_RE
+        _expressions = [re.escape(_kw).encode() for _kw in _INJURY_KEYWORDS]
+        _INJURY_HS_DB = hyperscan.Database()
+        _INJURY_HS_DB.compile(
+            expressions=_expressions,
+            ids=list(range(len(_expressions))),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_expressions),
+        )
+    except Exception:
+        _INJURY_HS_DB = None
+
 
 class ClaimRouter:
     """Routes claims to appropriate workflows based on business rules."""
-    
+
     # Routing destinations
     ROUTE_FAST_TRACK = "Fast-track"
     ROUTE_MANUAL_REVIEW = "Manual Review"
@@ -50,7 +109,8 @@ class ClaimRouter:
             )
         
         # Rule 2: Fraud indicators → Investigation
-        description = extracted_fields.get("incidentDescription", "")
+        # Fetched once and shared by the fraud and injury checks below
+        description = extracted_fields.get("incidentDescription") or ""
         if contains_fraud_indicators(description):
             return (
                 self.ROUTE_INVESTIGATION,
@@ -104,15 +164,28 @@ class ClaimRouter:
         Returns:
             True if claim involves injury
         """
-        injury_keywords = [
-            "injury", "injured", "bodily harm", "medical", 
-            "hospital", "ambulance", "hurt", "pain",
-            "personal injury", "bodily injury"
-        ]
-        
-        text_to_check = f"{claim_type} {description}".lower()
-        
-        return any(keyword in text_to_check for keyword in injury_keywords)
+        text_to_check = claim_type + ' ' + description
+
+        if _INJURY_HS_DB is not None:
+            matched = []
+
+            def _on_match(pattern_id, start, end, flags, context):
+                matched.append(pattern_id)
+                return True  # terminate the scan on first hit
+
+            try:
+                _INJURY_HS_DB.scan(
+                    text_to_check.encode('utf-8', 'ignore'),
+                    match_event_handler=_on_match
+                )
+            except hyperscan.error:
+                pass  # scan terminated early by the handler
+            return bool(matched)
+
+        if _INJURY_AC is not None:
+            return next(_INJURY_AC.iter(text_to_check.lower()), None) is not None
+
+        return bool(_INJURY_RE.search(text_to_check))
     
     def get_routing_summary(self) -> Dict[str, str]:
         """
@@ -4,9 +4,36 @@ Utility functions for the claims processing agent.
 import os
 import json
 import re
-from typing import Dict, Any, Optional
+
+# orjson is ~3-10x faster for dumps/loads; fall back to stdlib json if absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from datetime import datetime
-import PyPDF2
+
+# Cheap format classifiers so normalize_date can usually pick the right
+# strptime format directly instead of probing all of them via ValueError
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_SLASH_DATE_RE = re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$')
+_MONTH_NAME_DATE_RE = re.compile(r'^[A-Za-z]{3,9}\s+\d{1,2},\s+\d{4}$')
+
+# Month-name lookup for the hand-rolled date fast path
+_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10,
+    'november': 11, 'december': 12,
+}
+
+# Optional Numba-accelerated currency parsing (None when numba is missing)
+try:
+    from src.utils_fast import parse_currency_scalar as _parse_currency_fast
+except ImportError:
+    _parse_currency_fast = None
 
 
 def read_document(file_path: str) -> str:
@@ -32,18 +59,44 @@ def read_document(file_path: str) -> str:
         raise ValueError(f"Unsupported file format: {file_extension}")
 
 
+def read_documents_batch(file_paths: List[str]) -> List[str]:
+    """
+    Read several documents in parallel across CPU cores.
+
+    PyPDF2 parsing is pure-Python and holds the GIL, so a process pool is
+    what actually parallelizes a folder of PDFs.
+
+    Args:
+        file_paths: Paths to the document files
+
+    Returns:
+        Extracted text for each document, in input order
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(read_document, file_paths, chunksize=4))
+
+
 def read_pdf(file_path: str) -> str:
     """Extract text from a PDF file."""
-    text = ""
+    # Imported here so validator/router-only callers never pay the import cost
+    import PyPDF2
+
+    # Accumulate page text in a list and join once - repeated += on a growing
+    # string is quadratic for large PDFs
+    parts = []
     try:
         with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
+            pdf_reader = PyPDF2.PdfReader(file, strict=False)
             for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
+                page_text = page.extract_text()
+                if page_text:
+                    parts.append(page_text)
     except Exception as e:
         raise Exception(f"Error reading PDF: {str(e)}")
-    
-    return text.strip()
+
+    return "\n".join(parts).strip()
 
 
 def read_text(file_path: str) -> str:
@@ -71,13 +124,21 @@ def parse_currency(value: Any) -> Optional[float]:
         return float(value)
     
     if isinstance(value, str):
+        # Route through the JIT kernel when numba is installed; it declines
+        # anything it cannot parse confidently (e.g. exponents), in which
+        # case the regex path below decides
+        if _parse_currency_fast is not None:
+            result = _parse_currency_fast(value)
+            if result is not None:
+                return result
+
         # Remove currency symbols and commas
         cleaned = re.sub(r'[$,\s]', '', value)
         try:
             return float(cleaned)
         except ValueError:
             return None
-    
+
     return None
 
 
@@ -92,6 +153,10 @@ def format_output(result: Dict[str, Any], pretty: bool = True) -> str:
     Returns:
         JSON string
     """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(result, option=option).decode()
+
     if pretty:
         return json.dumps(result, indent=2, ensure_ascii=False)
     return json.dumps(result, ensure_ascii=False)
@@ -105,8 +170,12 @@ def save_output(result: Dict[str, Any], output_path: str) -> None:
         result: Result dictionary
         output_path: Path to save the output
     """
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
 
 
 def extract_number_from_text(text: str) -> Optional[float]:
@@ -122,39 +191,103 @@ def extract_number_from_text(text: str) -> Optional[float]:
     return None
 
 
+def _fast_normalize_date(date_str: str) -> Optional[str]:
+    """
+    Hand-rolled parser for the three dominant claim date formats
+    (YYYY-MM-DD, MM/DD/YYYY, 'Month DD, YYYY').
+
+    Returns None for anything it cannot handle so the caller can fall back
+    to the strptime probe loop. Avoids the strptime machinery (format
+    tokenizing, regex build, struct_time) for the common case.
+    """
+    # Already ISO
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        if date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit():
+            return date_str
+        return None
+
+    # MM/DD/YYYY (or DD/MM/YYYY when the first number can't be a month)
+    if '/' in date_str:
+        parts = date_str.split('/')
+        if len(parts) != 3:
+            return None
+        try:
+            month, day, year = (int(p) for p in parts)
+        except ValueError:
+            return None
+        if month > 12 and day <= 12:
+            month, day = day, month
+        try:
+            datetime(year, month, day)  # validates ranges cheaply
+        except ValueError:
+            return None
+        return f"{year:04d}-{month:02d}-{day:02d}"
+
+    # 'June 15, 2023' / 'Jun 15, 2023'
+    parts = date_str.replace(',', ' ').split()
+    if len(parts) == 3 and parts[1].isdigit() and parts[2].isdigit():
+        month = _MONTHS.get(parts[0].lower())
+        if month:
+            day, year = int(parts[1]), int(parts[2])
+            try:
+                datetime(year, month, day)
+            except ValueError:
+                return None
+            return f"{year:04d}-{month:02d}-{day:02d}"
+
+    return None
+
+
+@lru_cache(maxsize=4096)
 def normalize_date(date_str: str) -> Optional[str]:
     """
     Normalize date string to YYYY-MM-DD format.
-    
+
     Handles various date formats:
         - 06/15/2023
         - June 15, 2023
         - 15-06-2023
         - 2023-06-15
+
+    Results are memoized since claim documents repeat the same dates.
     """
     if not date_str:
         return None
-    
+
     date_str = str(date_str).strip()
-    
-    # Try different date formats
-    formats = [
-        "%Y-%m-%d",
-        "%m/%d/%Y",
-        "%d/%m/%Y",
-        "%B %d, %Y",
-        "%b %d, %Y",
-        "%d-%m-%Y",
-        "%m-%d-%Y",
-    ]
-    
+
+    # Hand-rolled fast path for the dominant formats
+    fast_result = _fast_normalize_date(date_str)
+    if fast_result is not None:
+        return fast_result
+
+    # Classify the format up front to avoid probing every format with a
+    # thrown ValueError per miss
+    if _ISO_DATE_RE.match(date_str):
+        formats = ["%Y-%m-%d"]
+    elif _SLASH_DATE_RE.match(date_str):
+        formats = ["%m/%d/%Y", "%d/%m/%Y"]
+    elif _MONTH_NAME_DATE_RE.match(date_str):
+        formats = ["%B %d, %Y", "%b %d, %Y"]
+    else:
+        # Ambiguous input: fall back to the full probe list
+        formats = [
+            "%Y-%m-%d",
+            "%m/%d/%Y",
+            "%d/%m/%Y",
+            "%B %d, %Y",
+            "%b %d, %Y",
+            "%d-%m-%Y",
+            "%m-%d-%Y",
+        ]
+
     for fmt in formats:
         try:
             dt = datetime.strptime(date_str, fmt)
             return dt.strftime("%Y-%m-%d")
         except ValueError:
             continue
-    
+
     return date_str  # Return as-is if no format matches
 
 
@@ -172,12 +305,72 @@ def get_fraud_indicators() -> list:
     ]
 
 
+# One compiled alternation covering every fraud indicator: a single C-level
+# scan replaces per-keyword substring searches plus a lowercase copy. Built
+# from get_fraud_indicators() with plain substring semantics (no \b), so it
+# matches exactly what the original per-keyword `in` checks matched and
+# extending the list extends the pattern.
+_FRAUD_RE = re.compile(
+    '|'.join(map(re.escape, get_fraud_indicators())),
+    re.IGNORECASE
+)
+
+# Optional Hyperscan backend: a vectorized DFA engine that scans multi-GB/s,
+# worth it for bulk ingestion of long descriptions. Falls back to _FRAUD_RE.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Optional Aho-Corasick backend: finds any of the keywords in one O(N) pass
+# and scales with keyword-list size at zero per-keyword cost
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+_FRAUD_AC = None
+if ahocorasick is not None:
+    _FRAUD_AC = ahocorasick.Automaton()
+    for _kw in get_fraud_indicators():
+        _FRAUD_AC.add_word(_kw, _kw)
+    _FRAUD_AC.make_automaton()
+
+_FRAUD_HS_DB = None
+if hyperscan is not None:
+    try:
+        # Escaped literals with no \b anchors: every backend does the same
+        # plain substring matching as _FRAUD_RE
+        _expressions = [re.escape(_kw).encode() for _kw in get_fraud_indicators()]
+        _FRAUD_HS_DB = hyperscan.Database()
+        _FRAUD_HS_DB.compile(
+            expressions=_expressions,
+            ids=list(range(len(_expressions))),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_expressions),
+        )
+    except Exception:
+        _FRAUD_HS_DB = None
+
+
 def contains_fraud_indicators(text: str) -> bool:
     """Check if text contains fraud indicator keywords."""
     if not text:
         return False
-    
-    text_lower = text.lower()
-    indicators = get_fraud_indicators()
-    
-    return any(indicator in text_lower for indicator in indicators)
+
+    if _FRAUD_HS_DB is not None:
+        matched = []
+
+        def _on_match(pattern_id, start, end, flags, context):
+            matched.append(pattern_id)
+            return True  # terminate the scan on first hit
+
+        try:
+            _FRAUD_HS_DB.scan(text.encode('utf-8', 'ignore'), match_event_handler=_on_match)
+        except hyperscan.error:
+            pass  # scan terminated early by the handler
+        return bool(matched)
+
+    if _FRAUD_AC is not None:
+        return next(_FRAUD_AC.iter(text.lower()), None) is not None
+
+    return _FRAUD_RE.search(text) is not None
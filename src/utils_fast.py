@@ -0,0 +1,101 @@
+"""
+Optional Numba-accelerated helpers for batch claim processing.
+
+Everything here degrades gracefully: when numba/numpy are not installed the
+public functions fall back to the pure-Python implementations in src.utils.
+"""
+from typing import Any, List, Optional
+
+# Try to import Numba (optional acceleration dependency)
+try:
+    import numpy as np
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True)
+    def _strip_currency(buf):
+        """
+        Parse a currency amount from a uint8 byte buffer.
+
+        Skips '$', ',', and whitespace, accumulating the integer and
+        fractional parts with integer math. Returns NaN for anything it
+        cannot parse confidently (misplaced signs, exponents, stray bytes)
+        so callers can fall back to the pure-Python path.
+        """
+        value = 0.0
+        frac = 0.0
+        scale = 0.1
+        seen_digit = False
+        in_frac = False
+        negative = False
+
+        for i in range(buf.size):
+            c = buf[i]
+            if c == 36 or c == 44 or c == 32 or (9 <= c <= 13):  # '$' ',' whitespace
+                continue
+            if c == 45:  # '-': only a single leading sign is a number
+                if negative or seen_digit or in_frac:
+                    return np.nan
+                negative = True
+            elif c == 46:  # '.'
+                if in_frac:
+                    return np.nan  # second decimal point: not a number
+                in_frac = True
+            elif 48 <= c <= 57:  # '0'-'9'
+                seen_digit = True
+                d = c - 48
+                if in_frac:
+                    frac += d * scale
+                    scale *= 0.1
+                else:
+                    value = value * 10.0 + d
+            else:
+                return np.nan
+
+        if not seen_digit:
+            return np.nan
+
+        total = value + frac
+        return -total if negative else total
+
+    def parse_currency_scalar(value: str) -> Optional[float]:
+        """Parse one currency string through the JIT kernel."""
+        buf = np.frombuffer(value.encode('utf-8'), dtype=np.uint8)
+        result = _strip_currency(buf)
+        return None if result != result else result  # NaN -> None
+
+    def parse_currency_batch(values: List[Any]) -> "np.ndarray":
+        """
+        Parse a batch of currency strings into a float64 array.
+
+        Unparseable entries come back as NaN.
+        """
+        from src.utils import parse_currency
+
+        out = np.empty(len(values), dtype=np.float64)
+        for i, v in enumerate(values):
+            if v is None:
+                out[i] = np.nan
+            elif isinstance(v, (int, float)):
+                out[i] = float(v)
+            else:
+                result = parse_currency_scalar(str(v))
+                if result is None:
+                    # Kernel declined (e.g. exponent notation): let the
+                    # pure-Python parser make the call
+                    result = parse_currency(str(v))
+                out[i] = np.nan if result is None else result
+        return out
+
+else:
+    parse_currency_scalar = None
+
+    def parse_currency_batch(values: List[Any]) -> List[Optional[float]]:
+        """Pure-Python fallback when numba is not installed."""
+        from src.utils import parse_currency
+        return [parse_currency(v) for v in values]
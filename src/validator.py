@@ -1,7 +1,7 @@
 """
 Field validator for FNOL documents.
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 
 
 class FieldValidator:
@@ -23,59 +23,64 @@ class FieldValidator:
         "estimatedDamage",
         "claimType",
     ]
-    
+
+    # Paths pre-split once at class definition so validate() does no string
+    # work per call
+    _MANDATORY_PATHS: List[Tuple[str, ...]] = [
+        tuple(f.split('.')) for f in MANDATORY_FIELDS
+    ]
+
     def validate(self, extracted_fields: Dict[str, Any]) -> List[str]:
         """
         Validate extracted fields and return list of missing fields.
-        
+
         Args:
             extracted_fields: Dictionary of extracted fields
-            
+
         Returns:
             List of missing field names
         """
         missing_fields = []
-        
-        for field_path in self.MANDATORY_FIELDS:
-            if not self._is_field_present(extracted_fields, field_path):
+
+        for field_path, parts in zip(self.MANDATORY_FIELDS, self._MANDATORY_PATHS):
+            if not self._is_field_present(extracted_fields, parts):
                 missing_fields.append(field_path)
-        
+
         return missing_fields
-    
-    def _is_field_present(self, data: Dict[str, Any], field_path: str) -> bool:
+
+    def _is_field_present(self, data: Dict[str, Any], parts: Tuple[str, ...]) -> bool:
         """
         Check if a field (including nested fields) is present and not empty.
-        
+
         Args:
             data: Dictionary containing the data
-            field_path: Dot-separated path to the field (e.g., "effectiveDates.start")
-            
+            parts: Pre-split field path (e.g., ("effectiveDates", "start"))
+
         Returns:
             True if field is present and not None/empty
         """
-        parts = field_path.split('.')
         current = data
-        
+
         for part in parts:
-            if not isinstance(current, dict):
+            # Exact type checks skip the MRO walk isinstance() would do
+            if type(current) is not dict:
                 return False
-            
+
             current = current.get(part)
-            
+
             if current is None:
                 return False
-        
+
         # Check if value is meaningful
-        if isinstance(current, str):
-            return bool(current.strip())
-        elif isinstance(current, (int, float)):
+        value_type = type(current)
+        if value_type is str:
+            return current.strip() != ''
+        if value_type is int or value_type is float:
             return True  # Numbers (including 0) are valid
-        elif isinstance(current, list):
-            return len(current) > 0
-        elif isinstance(current, dict):
-            return len(current) > 0
-        
-        return current is not None
+        if value_type is list or value_type is dict:
+            return bool(current)
+
+        return True  # Non-None value of any other type
     
     def get_field_name_display(self, field_path: str) -> str:
         """
@@ -0,0 +1,160 @@
+"""
+Shared pytest configuration for the test suite.
+"""
+import os
+import json
+import shutil
+import hashlib
+from pathlib import Path
+
+import pytest
+
+# Must match src.extractor._LLM_CACHE_DIR
+_LLM_CACHE_DIR = ".pytest_llm_cache"
+
+# Recorded Gemini responses committed alongside the tests, keyed by the
+# SHA-256 of the prompt that produced them
+_GEMINI_FIXTURE_DIR = Path(__file__).parent / "fixtures" / "gemini_responses"
+
+
+def _llm_mode():
+    """
+    Resolve the recorder mode: SYNAPX_LLM_MODE wins, then SYNAPX_RECORD=1
+    means record. Otherwise a real GEMINI_API_KEY defaults to record so
+    plain `pytest` still exercises the live pipeline (capturing recordings
+    as it goes), and keyless runs replay whatever is committed.
+    """
+    mode = os.getenv("SYNAPX_LLM_MODE")
+    if mode:
+        return mode
+    if os.getenv("SYNAPX_RECORD") or os.getenv("GEMINI_API_KEY"):
+        return "record"
+    return "replay"
+
+
+def pytest_configure(config):
+    """Warm the Gemini HTTP connection so the first live call skips TLS setup."""
+    if _llm_mode() == "replay" or not os.getenv("GEMINI_API_KEY"):
+        return  # replayed runs never reach the network
+
+    try:
+        import google.generativeai as genai
+
+        genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+        # Minimal fire-and-forget request to establish the connection pool;
+        # the session-scoped agent then reuses the warm connection
+        genai.GenerativeModel('gemini-pro').generate_content(
+            "ping", generation_config={"max_output_tokens": 1}
+        )
+    except Exception:
+        pass  # warm-up is best-effort only
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Clear the on-disk Gemini response cache before the run",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def llm_response_cache(request):
+    """Enable the on-disk Gemini response cache for the whole session."""
+    if request.config.getoption("--no-cache"):
+        shutil.rmtree(_LLM_CACHE_DIR, ignore_errors=True)
+    os.environ.setdefault("SYNAPX_TEST_CACHE", "1")
+
+
+class _RecordedResponse:
+    """Stand-in for a Gemini response object, exposing just .text."""
+
+    def __init__(self, text):
+        self.text = text
+
+
+def _fixture_path_for(prompt):
+    return _GEMINI_FIXTURE_DIR / f"{hashlib.sha256(prompt.encode('utf-8')).hexdigest()}.json"
+
+
+def _read_recording(fixture_path):
+    return _RecordedResponse(json.loads(fixture_path.read_text())["text"])
+
+
+def _write_recording(fixture_path, response):
+    _GEMINI_FIXTURE_DIR.mkdir(parents=True, exist_ok=True)
+    fixture_path.write_text(json.dumps({"text": response.text}, indent=2))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def gemini_recorder():
+    """
+    VCR-style recorder for Gemini calls, controlled by SYNAPX_LLM_MODE.
+
+    Recordings live in tests/fixtures/gemini_responses/{sha256(prompt)}.json
+    and are committed to git so CI and `pytest --lf` loops replay them in
+    milliseconds instead of re-calling the API.
+
+    Modes:
+        replay (default without a key): serve recordings; skip tests whose
+            prompt has none
+        record (default with a key): serve recordings when present, call the
+            live API on a miss and save the recording
+        live: leave the SDK untouched
+
+    SYNAPX_RECORD=1 is shorthand for record mode. In replay mode recordings
+    need no credentials; a placeholder key lets the extractor initialize its
+    (patched) Gemini model.
+    """
+    mode = _llm_mode()
+    if mode == "live":
+        yield mode
+        return
+
+    import src.extractor as extractor
+
+    if not extractor._import_genai():
+        yield mode
+        return
+
+    mp = pytest.MonkeyPatch()
+    replayable = _GEMINI_FIXTURE_DIR.is_dir() and any(_GEMINI_FIXTURE_DIR.glob("*.json"))
+    if not os.getenv("GEMINI_API_KEY") and mode == "replay" and replayable:
+        mp.setenv("GEMINI_API_KEY", "replay-placeholder")
+
+    model_cls = extractor.genai.GenerativeModel
+    real_generate = model_cls.generate_content
+    real_generate_async = getattr(model_cls, 'generate_content_async', None)
+
+    def _miss(fixture_path):
+        pytest.skip(
+            f"No recorded Gemini response for this prompt ({fixture_path.name}); "
+            "run with SYNAPX_LLM_MODE=record to capture it"
+        )
+
+    def _generate(model_self, prompt, *args, **kwargs):
+        fixture_path = _fixture_path_for(prompt)
+        if fixture_path.exists():
+            return _read_recording(fixture_path)
+        if mode == "record":
+            response = real_generate(model_self, prompt, *args, **kwargs)
+            _write_recording(fixture_path, response)
+            return response
+        _miss(fixture_path)
+
+    async def _generate_async(model_self, prompt, *args, **kwargs):
+        fixture_path = _fixture_path_for(prompt)
+        if fixture_path.exists():
+            return _read_recording(fixture_path)
+        if mode == "record":
+            response = await real_generate_async(model_self, prompt, *args, **kwargs)
+            _write_recording(fixture_path, response)
+            return response
+        _miss(fixture_path)
+
+    mp.setattr(model_cls, "generate_content", _generate)
+    if real_generate_async is not None:
+        mp.setattr(model_cls, "generate_content_async", _generate_async)
+    yield mode
+    mp.undo()
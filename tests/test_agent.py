@@ -3,65 +3,123 @@ Automated tests for the Claims Processing Agent.
 """
 import pytest
 import os
+import types
 from pathlib import Path
-from src.agent import ClaimsProcessingAgent
-from src.extractor import FieldExtractor
+# src.agent (and the Gemini SDK behind it) is imported lazily inside the
+# agent fixture, so collection and router/validator-only runs stay fast
 from src.validator import FieldValidator
 from src.router import ClaimRouter
 
+# Canonical validator inputs, frozen so no test can mutate them. _COMPLETE_DATA
+# doubles as a reference for the full mandatory-field schema.
+_COMPLETE_DATA = types.MappingProxyType({
+    "policyNumber": "POL-123",
+    "policyholderName": "John Doe",
+    "effectiveDates": {"start": "2023-01-01", "end": "2024-01-01"},
+    "incidentDate": "2023-06-15",
+    "incidentTime": "14:30",
+    "incidentLocation": "123 Main St",
+    "incidentDescription": "Accident",
+    "claimantName": "John Doe",
+    "assetType": "Vehicle",
+    "assetId": "VIN123",
+    "estimatedDamage": 15000,
+    "claimType": "Auto",
+})
+
+_INCOMPLETE_DATA = types.MappingProxyType({
+    "policyNumber": "POL-123",
+    "policyholderName": None,
+})
+
+# Resolved once at import; .resolve() canonicalizes the path so later
+# existence checks don't re-walk symlinks
+_SAMPLE_DIR = Path(__file__).resolve().parent.parent / "sample_documents"
+
+# Snapshotted once at import so xdist workers don't re-read the environment
+# per fixture. gemini_recorder (conftest.py) may install a replay placeholder
+# key later, so the agent fixture only re-checks the environment when this
+# is False.
+_HAS_KEY = bool(os.getenv('GEMINI_API_KEY'))
+
+
+@pytest.fixture(scope="session")
+def agent(gemini_recorder):
+    """Create a single agent instance shared across the whole test session."""
+    # gemini_recorder installs a placeholder key when recorded responses
+    # exist, so this only skips when neither a key nor recordings are
+    # available
+    if not _HAS_KEY and not os.getenv('GEMINI_API_KEY'):
+        pytest.skip("GEMINI_API_KEY not set and no recorded Gemini responses")
+    # Skip (once, at the session fixture) rather than error every dependent
+    # test when the agent's optional deps are broken or missing. Router and
+    # validator tests are unaffected since they never touch this fixture.
+    agent_module = pytest.importorskip("src.agent", reason="agent deps missing")
+
+    # ClaimsProcessingAgent holds no per-claim state, so one instance (and
+    # its underlying Gemini client) can safely serve every test
+    return agent_module.ClaimsProcessingAgent()
+
+
+@pytest.fixture(scope="session")
+def sample_dir():
+    """Get sample documents directory."""
+    return _SAMPLE_DIR
 
-@pytest.fixture
-def agent():
-    """Create a test agent instance."""
-    # Skip if no API key
-    if not os.getenv('GEMINI_API_KEY'):
-        pytest.skip("GEMINI_API_KEY not set")
-    return ClaimsProcessingAgent()
 
+@pytest.fixture(scope="session")
+def validator():
+    """Single FieldValidator shared by the unit tests (it is stateless)."""
+    return FieldValidator()
 
-@pytest.fixture
-def sample_dir():
-    """Get sample documents directory."""
-    return Path(__file__).parent.parent / "sample_documents"
 
+@pytest.fixture(scope="session")
+def router():
+    """Single ClaimRouter shared by the unit tests (it is stateless)."""
+    return ClaimRouter()
 
-def test_validator_missing_fields():
-    """Test field validation."""
-    validator = FieldValidator()
-    
-    # Complete data
-    complete_data = {
-        "policyNumber": "POL-123",
-        "policyholderName": "John Doe",
-        "effectiveDates": {"start": "2023-01-01", "end": "2024-01-01"},
-        "incidentDate": "2023-06-15",
-        "incidentTime": "14:30",
-        "incidentLocation": "123 Main St",
-        "incidentDescription": "Accident",
-        "claimantName": "John Doe",
-        "assetType": "Vehicle",
-        "assetId": "VIN123",
-        "estimatedDamage": 15000,
-        "claimType": "Auto"
+
+@pytest.fixture(scope="session")
+def available_claims(sample_dir):
+    """Filenames in sample_documents, from a single directory scan."""
+    try:
+        with os.scandir(sample_dir) as it:
+            return frozenset(entry.name for entry in it)
+    except FileNotFoundError:
+        return frozenset()
+
+
+@pytest.fixture(scope="session")
+def sample_claims(sample_dir, available_claims):
+    """Read every sample claim file once into memory for the session."""
+    return {
+        name: (sample_dir / name).read_bytes()
+        for name in available_claims
+        if name.startswith("claim_") and name.endswith(".txt")
     }
-    
-    missing = validator.validate(complete_data)
+
+
+@pytest.fixture(scope="session")
+def all_claim_results(agent, sample_claims):
+    """Process every available sample claim in one batched Gemini request."""
+    names = sorted(sample_claims)
+    texts = [sample_claims[n].decode('utf-8').strip() for n in names]
+    return dict(zip(names, agent.process_claims_batch_texts(texts)))
+
+
+def test_validator_missing_fields(validator):
+    """Test field validation."""
+    # validate's exact-type dict checks don't accept the proxy itself, so
+    # hand it a plain-dict copy
+    missing = validator.validate(dict(_COMPLETE_DATA))
     assert len(missing) == 0, "Should have no missing fields"
-    
-    # Incomplete data
-    incomplete_data = {
-        "policyNumber": "POL-123",
-        "policyholderName": None,
-    }
-    
-    missing = validator.validate(incomplete_data)
+
+    missing = validator.validate(dict(_INCOMPLETE_DATA))
     assert len(missing) > 0, "Should have missing fields"
 
 
-def test_router_fast_track():
+def test_router_fast_track(router):
     """Test fast-track routing."""
-    router = ClaimRouter()
-    
     fields = {
         "estimatedDamage": 15000,
         "incidentDescription": "Normal accident",
@@ -73,10 +131,8 @@ def test_router_fast_track():
     assert "fast-track" in reasoning.lower()
 
 
-def test_router_high_value():
+def test_router_high_value(router):
     """Test high-value claim routing."""
-    router = ClaimRouter()
-    
     fields = {
         "estimatedDamage": 50000,
         "incidentDescription": "Severe damage",
@@ -88,10 +144,8 @@ def test_router_high_value():
     assert "exceeds" in reasoning.lower()
 
 
-def test_router_fraud():
+def test_router_fraud(router):
     """Test fraud detection routing."""
-    router = ClaimRouter()
-    
     fields = {
         "estimatedDamage": 10000,
         "incidentDescription": "The damage seems staged and inconsistent",
@@ -103,10 +157,8 @@ def test_router_fraud():
     assert "fraud" in reasoning.lower() or "investigation" in reasoning.lower()
 
 
-def test_router_injury():
+def test_router_injury(router):
     """Test injury claim routing."""
-    router = ClaimRouter()
-    
     fields = {
         "estimatedDamage": 15000,
         "incidentDescription": "Accident with bodily injury",
@@ -118,10 +170,8 @@ def test_router_injury():
     assert "injury" in reasoning.lower()
 
 
-def test_router_missing_fields():
+def test_router_missing_fields(router):
     """Test missing fields routing."""
-    router = ClaimRouter()
-    
     fields = {
         "estimatedDamage": 10000
     }
@@ -133,77 +183,68 @@ def test_router_missing_fields():
     assert "missing" in reasoning.lower()
 
 
-def test_sample_claim_001(agent, sample_dir):
-    """Test processing of sample claim 001 (fast-track)."""
-    claim_file = sample_dir / "claim_001.txt"
-    
-    if not claim_file.exists():
-        pytest.skip("Sample file not found")
-    
-    result = agent.process_claim(str(claim_file))
-    
-    assert "extractedFields" in result
-    assert "missingFields" in result
-    assert "recommendedRoute" in result
-    assert "reasoning" in result
-    
-    # Should be fast-track
-    assert result["recommendedRoute"] == "Fast-track"
+def test_router_fraud_substring(router):
+    """Substring fraud hits ('fraudulently') flag investigation on every backend."""
+    fields = {
+        "estimatedDamage": 10000,
+        "incidentDescription": "The other driver acted fraudulently",
+        "claimType": "Auto"
+    }
 
+    route, _ = router.route_claim(fields, [])
+    assert route == router.ROUTE_INVESTIGATION
 
-def test_sample_claim_002(agent, sample_dir):
-    """Test processing of sample claim 002 (high-value)."""
-    claim_file = sample_dir / "claim_002.txt"
-    
-    if not claim_file.exists():
-        pytest.skip("Sample file not found")
-    
-    result = agent.process_claim(str(claim_file))
-    
-    # Should be manual review due to high value
-    assert result["recommendedRoute"] == "Manual Review"
 
+def test_router_injury_substring(router):
+    """Substring injury hits ('hospitalized') route to specialists on every backend."""
+    fields = {
+        "estimatedDamage": 5000,
+        "incidentDescription": "The claimant was hospitalized overnight",
+        "claimType": "Auto"
+    }
 
-def test_sample_claim_003(agent, sample_dir):
-    """Test processing of sample claim 003 (fraud indicators)."""
-    claim_file = sample_dir / "claim_003.txt"
-    
-    if not claim_file.exists():
-        pytest.skip("Sample file not found")
-    
-    result = agent.process_claim(str(claim_file))
-    
-    # Should be investigation flag
-    assert result["recommendedRoute"] == "Investigation Flag"
+    route, _ = router.route_claim(fields, [])
+    assert route == router.ROUTE_SPECIALIST
 
 
-def test_sample_claim_004(agent, sample_dir):
-    """Test processing of sample claim 004 (injury)."""
-    claim_file = sample_dir / "claim_004.txt"
-    
-    if not claim_file.exists():
-        pytest.skip("Sample file not found")
-    
-    result = agent.process_claim(str(claim_file))
-    
-    # Should be specialist queue
-    assert result["recommendedRoute"] == "Specialist Queue"
+def test_pattern_extractor_same_line_labels():
+    """Fields are still extracted when two labels share one line."""
+    from src.extractor import PatternBasedExtractor
 
+    extractor = PatternBasedExtractor()
 
-def test_sample_claim_005(agent, sample_dir):
-    """Test processing of sample claim 005 (missing fields)."""
-    claim_file = sample_dir / "claim_005.txt"
-    
-    if not claim_file.exists():
+    fields = extractor.extract_fields("Policyholder Name: Alice Smith Policy Number: POL-777")
+    assert fields["policyholderName"] == "Alice Smith"
+    assert fields["policyNumber"] == "POL-777"
+
+    fields = extractor.extract_fields("Claimant: Jane Roe Contact: 555-0000")
+    assert fields["claimantName"] == "Jane Roe"
+    assert fields["claimantContact"] == "555-0000"
+
+
+@pytest.mark.network
+@pytest.mark.integration
+@pytest.mark.parametrize("fname,expected_route,min_missing", [
+    ("claim_001.txt", "Fast-track", 0),
+    ("claim_002.txt", "Manual Review", 0),
+    ("claim_003.txt", "Investigation Flag", 0),
+    ("claim_004.txt", "Specialist Queue", 0),
+    ("claim_005.txt", "Manual Review", 1),
+])
+def test_sample_claim(available_claims, all_claim_results, fname, expected_route, min_missing):
+    """Test end-to-end processing of each sample claim document."""
+    if fname not in available_claims:
         pytest.skip("Sample file not found")
-    
-    result = agent.process_claim(str(claim_file))
-    
-    # Should have missing fields
-    assert len(result["missingFields"]) > 0
-    
-    # Should be manual review
-    assert result["recommendedRoute"] == "Manual Review"
+
+    result = all_claim_results[fname]
+
+    assert "extractedFields" in result
+    assert "missingFields" in result
+    assert "recommendedRoute" in result
+    assert "reasoning" in result
+
+    assert len(result["missingFields"]) >= min_missing
+    assert result["recommendedRoute"] == expected_route
 
 
 if __name__ == "__main__":